@@ -35,12 +35,16 @@ from collections import namedtuple
 import time
 from micropython import const
 
-# TODO: Remove on release
-from .debug import channels, reports
+# debug names are only used for debug output, so builds may leave debug.py out
+try:
+    from .debug import channels, reports
+except ImportError:
+    channels = {}
+    reports = {}
 
 # For IDE type recognition
 try:
-    from typing import Any, Dict, List, Optional, Tuple, Union
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Union
     from digitalio import DigitalInOut
 except ImportError:
     pass
@@ -121,6 +125,12 @@ _DEFAULT_TIMEOUT = 2.0
 _BNO08X_CMD_RESET = const(0x01)
 _QUAT_Q_POINT = const(14)
 _BNO_HEADER_LEN = const(4)
+# report ids below this are sensor reports, the rest are control/command reports
+_MIN_CONTROL_REPORT_ID = const(0xF0)
+# sensor report layout: report id, sequence number, status (accuracy in the low
+# two bits), delay, then the 16-bit data fields
+_SENSOR_REPORT_STATUS_OFFSET = const(2)
+_SENSOR_REPORT_DATA_OFFSET = const(4)
 
 _Q_POINT_14_SCALAR = 2 ** (14 * -1)
 _Q_POINT_12_SCALAR = 2 ** (12 * -1)
@@ -149,23 +159,29 @@ _RAW_REPORTS = {
     BNO_REPORT_RAW_GYROSCOPE: BNO_REPORT_GYROSCOPE,
     BNO_REPORT_RAW_MAGNETOMETER: BNO_REPORT_MAGNETOMETER,
 }
-_AVAIL_SENSOR_REPORTS = {
-    BNO_REPORT_ACCELEROMETER: (_Q_POINT_8_SCALAR, 3, 10),
-    BNO_REPORT_GRAVITY: (_Q_POINT_8_SCALAR, 3, 10),
-    BNO_REPORT_GYROSCOPE: (_Q_POINT_9_SCALAR, 3, 10),
-    BNO_REPORT_MAGNETOMETER: (_Q_POINT_4_SCALAR, 3, 10),
-    BNO_REPORT_LINEAR_ACCELERATION: (_Q_POINT_8_SCALAR, 3, 10),
-    BNO_REPORT_ROTATION_VECTOR: (_Q_POINT_14_SCALAR, 4, 14),
-    BNO_REPORT_GEOMAGNETIC_ROTATION_VECTOR: (_Q_POINT_12_SCALAR, 4, 14),
-    BNO_REPORT_GAME_ROTATION_VECTOR: (_Q_POINT_14_SCALAR, 4, 12),
-    BNO_REPORT_STEP_COUNTER: (1, 1, 12),
-    BNO_REPORT_SHAKE_DETECTOR: (1, 1, 6),
-    BNO_REPORT_STABILITY_CLASSIFIER: (1, 1, 6),
-    BNO_REPORT_ACTIVITY_CLASSIFIER: (1, 1, 16),
-    BNO_REPORT_RAW_ACCELEROMETER: (1, 3, 16),
-    BNO_REPORT_RAW_GYROSCOPE: (1, 3, 16),
-    BNO_REPORT_RAW_MAGNETOMETER: (1, 3, 16),
-}
+# (scalar, count, report length) for each sensor report, indexed directly by report id
+_AVAIL_SENSOR_REPORTS = [None] * 0x20
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_ACCELEROMETER] = (_Q_POINT_8_SCALAR, 3, 10)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_GRAVITY] = (_Q_POINT_8_SCALAR, 3, 10)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_GYROSCOPE] = (_Q_POINT_9_SCALAR, 3, 10)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_MAGNETOMETER] = (_Q_POINT_4_SCALAR, 3, 10)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_LINEAR_ACCELERATION] = (_Q_POINT_8_SCALAR, 3, 10)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_ROTATION_VECTOR] = (_Q_POINT_14_SCALAR, 4, 14)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_GEOMAGNETIC_ROTATION_VECTOR] = (
+    _Q_POINT_12_SCALAR,
+    4,
+    14,
+)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_GAME_ROTATION_VECTOR] = (_Q_POINT_14_SCALAR, 4, 12)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_STEP_COUNTER] = (1, 1, 12)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_SHAKE_DETECTOR] = (1, 1, 6)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_STABILITY_CLASSIFIER] = (1, 1, 6)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_ACTIVITY_CLASSIFIER] = (1, 1, 16)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_RAW_ACCELEROMETER] = (1, 3, 16)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_RAW_GYROSCOPE] = (1, 3, 16)
+_AVAIL_SENSOR_REPORTS[BNO_REPORT_RAW_MAGNETOMETER] = (1, 3, 16)
+_AVAIL_SENSOR_REPORTS = tuple(_AVAIL_SENSOR_REPORTS)
+
 _INITIAL_REPORTS = {
     BNO_REPORT_ACTIVITY_CLASSIFIER: {
         "Tilting": -1,
@@ -191,6 +207,17 @@ _ENABLED_ACTIVITIES = (
 )
 
 DATA_BUFFER_SIZE = const(512)  # data buffer size. obviously eats ram
+
+# struct formats shared by the parsers so each field group is a single unpack call
+_HEADER_FORMAT = "<HBB"  # packet byte count, channel, sequence number
+_XYZ_FORMAT = "<hhh"
+_QUAT_FORMAT = "<hhhh"
+_RAW_XYZ_FORMAT = "<HHH"  # raw reports are unsigned
+# product id response: report id and reset cause are skipped, then
+# sw major, sw minor, sw part number, sw build number, sw patch
+_PRODUCT_ID_FORMAT = "<xxBBIIH"
+# set feature command: report interval, batch interval, sensor specific config
+_FEATURE_CONFIG_FORMAT = "<III"
 PacketHeader = namedtuple(
     "PacketHeader",
     [
@@ -201,6 +228,26 @@ PacketHeader = namedtuple(
     ],
 )
 
+_STABILITY_CLASSIFICATIONS = (
+    "Unknown",
+    "On Table",
+    "Stationary",
+    "Stable",
+    "In motion",
+)
+
+_ACTIVITIES = (
+    "Unknown",
+    "In-Vehicle",  # look
+    "On-Bicycle",  # at
+    "On-Foot",  # all
+    "Still",  # this
+    "Tilting",  # room
+    "Walking",  # for
+    "Running",  # activities
+    "OnStairs",
+)
+
 REPORT_ACCURACY_STATUS = [
     "Accuracy Unreliable",
     "Low Accuracy",
@@ -215,33 +262,60 @@ class PacketError(Exception):
     pass  # pylint:disable=unnecessary-pass
 
 
-def _elapsed(start_time: float) -> float:
-    return time.monotonic() - start_time
+############ PACKET PARSING ###########################
+def _sensor_report_parser(report_id: int) -> Optional[Callable]:
+    """Returns a parser for a three or four axis sensor report with its scalar and
+    format fixed, or None if the report isn't one"""
+    # the parsers' keyword defaults bind globals as locals for faster lookups, and the
+    # data fields are assumed to start at the same offset in every report
+    try:
+        scalar, count, _report_length = _AVAIL_SENSOR_REPORTS[report_id]
+    except (IndexError, TypeError):
+        return None
+    if count == 4:
+
+        def parse_quaternion(
+            report_bytes: bytearray,
+            _unpack_from: Any = unpack_from,
+            _scalar: float = scalar,
+        ) -> Tuple[Tuple, int]:
+            raw_data = _unpack_from(
+                _QUAT_FORMAT, report_bytes, _SENSOR_REPORT_DATA_OFFSET
+            )
+            return (
+                (
+                    raw_data[0] * _scalar,
+                    raw_data[1] * _scalar,
+                    raw_data[2] * _scalar,
+                    raw_data[3] * _scalar,
+                ),
+                report_bytes[_SENSOR_REPORT_STATUS_OFFSET] & 0b11,
+            )
 
+        return parse_quaternion
+    if count == 3:
+        format_str = _RAW_XYZ_FORMAT if report_id in _RAW_REPORTS else _XYZ_FORMAT
+
+        def parse_vector(
+            report_bytes: bytearray,
+            _unpack_from: Any = unpack_from,
+            _format: str = format_str,
+            _scalar: float = scalar,
+        ) -> Tuple[Tuple, int]:
+            raw_data = _unpack_from(_format, report_bytes, _SENSOR_REPORT_DATA_OFFSET)
+            return (
+                (raw_data[0] * _scalar, raw_data[1] * _scalar, raw_data[2] * _scalar),
+                report_bytes[_SENSOR_REPORT_STATUS_OFFSET] & 0b11,
+            )
 
-############ PACKET PARSING ###########################
-def _parse_sensor_report_data(report_bytes: bytearray) -> Tuple[Tuple, int]:
-    """Parses reports with only 16-bit fields"""
-    data_offset = 4  # this may not always be true
-    report_id = report_bytes[0]
-    scalar, count, _report_length = _AVAIL_SENSOR_REPORTS[report_id]
-    if report_id in _RAW_REPORTS:
-        # raw reports are unsigned
-        format_str = "<H"
-    else:
-        format_str = "<h"
-    results = []
-    accuracy = unpack_from("<B", report_bytes, offset=2)[0]
-    accuracy &= 0b11
-
-    for _offset_idx in range(count):
-        total_offset = data_offset + (_offset_idx * 2)
-        raw_data = unpack_from(format_str, report_bytes, offset=total_offset)[0]
-        scaled_data = raw_data * scalar
-        results.append(scaled_data)
-    results_tuple = tuple(results)
-
-    return (results_tuple, accuracy)
+        return parse_vector
+    return None
+
+
+# parsers for the three and four axis sensor reports, indexed by report id
+_SENSOR_REPORT_PARSERS = tuple(
+    _sensor_report_parser(report_id) for report_id in range(len(_AVAIL_SENSOR_REPORTS))
+)
 
 
 def _parse_step_couter_report(report_bytes: bytearray) -> int:
@@ -250,9 +324,7 @@ def _parse_step_couter_report(report_bytes: bytearray) -> int:
 
 def _parse_stability_classifier_report(report_bytes: bytearray) -> str:
     classification_bitfield = unpack_from("<B", report_bytes, offset=4)[0]
-    return ["Unknown", "On Table", "Stationary", "Stable", "In motion"][
-        classification_bitfield
-    ]
+    return _STABILITY_CLASSIFICATIONS[classification_bitfield]
 
 
 # report_id
@@ -274,18 +346,7 @@ def _parse_get_feature_response_report(report_bytes: bytearray) -> Tuple[Any, ..
 # 5 Most likely state
 # 6-15 Classification (10 x Page Number) + confidence
 def _parse_activity_classifier_report(report_bytes: bytearray) -> Dict[str, str]:
-    activities = [
-        "Unknown",
-        "In-Vehicle",  # look
-        "On-Bicycle",  # at
-        "On-Foot",  # all
-        "Still",  # this
-        "Tilting",  # room
-        "Walking",  # for
-        "Running",  # activities
-        "OnStairs",
-    ]
-
+    activities = _ACTIVITIES
     end_and_page_number = unpack_from("<B", report_bytes, offset=4)[0]
     # last_page = (end_and_page_number & 0b10000000) > 0
     page_number = end_and_page_number & 0x7F
@@ -311,11 +372,13 @@ def parse_sensor_id(buffer: bytearray) -> Tuple[int, ...]:
     if not buffer[0] == _SHTP_REPORT_PRODUCT_ID_RESPONSE:
         raise AttributeError("Wrong report id for sensor id: %s" % hex(buffer[0]))
 
-    sw_major = unpack_from("<B", buffer, offset=2)[0]
-    sw_minor = unpack_from("<B", buffer, offset=3)[0]
-    sw_patch = unpack_from("<H", buffer, offset=12)[0]
-    sw_part_number = unpack_from("<I", buffer, offset=4)[0]
-    sw_build_number = unpack_from("<I", buffer, offset=8)[0]
+    (
+        sw_major,
+        sw_minor,
+        sw_part_number,
+        sw_build_number,
+        sw_patch,
+    ) = unpack_from(_PRODUCT_ID_FORMAT, buffer)
 
     return (sw_part_number, sw_major, sw_minor, sw_patch, sw_build_number)
 
@@ -358,8 +421,11 @@ def _insert_command_request_report(
 
 
 def _report_length(report_id: int) -> int:
-    if report_id < 0xF0:  # it's a sensor report
-        return _AVAIL_SENSOR_REPORTS[report_id][2]
+    if report_id < _MIN_CONTROL_REPORT_ID:  # it's a sensor report
+        try:
+            return _AVAIL_SENSOR_REPORTS[report_id][2]
+        except (IndexError, TypeError):  # not a known sensor report
+            raise KeyError(report_id) from None
 
     return _REPORT_LENGTHS[report_id]
 
@@ -367,64 +433,77 @@ def _report_length(report_id: int) -> int:
 def _separate_batch(packet: Packet, report_slices: List[Any]) -> None:
     # get first report id, loop up its report length
     # read that many bytes, parse them
+    data = packet.data
+    data_length = packet.header.data_length
     next_byte_index = 0
-    while next_byte_index < packet.header.data_length:
-        report_id = packet.data[next_byte_index]
+    while next_byte_index < data_length:
+        report_id = data[next_byte_index]
         required_bytes = _report_length(report_id)
 
-        unprocessed_byte_count = packet.header.data_length - next_byte_index
+        unprocessed_byte_count = data_length - next_byte_index
 
         # handle incomplete remainder
         if unprocessed_byte_count < required_bytes:
             raise RuntimeError("Unprocessable Batch bytes", unprocessed_byte_count)
         # we have enough bytes to read
         # add a slice to the list that was passed in
-        report_slice = packet.data[next_byte_index : next_byte_index + required_bytes]
+        report_slice = data[next_byte_index : next_byte_index + required_bytes]
 
-        report_slices.append([report_slice[0], report_slice])
+        report_slices.append((report_slice[0], report_slice))
         next_byte_index = next_byte_index + required_bytes
 
 
 class Packet:
     """A class representing a Hillcrest LaboratorySensor Hub Transport packet"""
 
-    def __init__(self, packet_bytes: bytearray) -> None:
-        self.header = self.header_from_buffer(packet_bytes)
+    __slots__ = ("header", "data")
+
+    def __init__(
+        self,
+        packet_bytes: Union[bytearray, memoryview],
+        header: Optional[PacketHeader] = None,
+    ) -> None:
+        # readers have usually parsed the header already to size the read
+        if header is None:
+            header = self.header_from_buffer(packet_bytes)
+        self.header = header
         data_end_index = self.header.data_length + _BNO_HEADER_LEN
+        # slicing a memoryview doesn't copy, so the data is only valid until the
+        # buffer is reused for another read or send
         self.data = packet_bytes[_BNO_HEADER_LEN:data_end_index]
 
     def __str__(self) -> str:
         length = self.header.packet_byte_count
-        outstr = "\n\t\t********** Packet *************\n"
-        outstr += "DBG::\t\t HEADER:\n"
+        parts = ["\n\t\t********** Packet *************\n", "DBG::\t\t HEADER:\n"]
+        append = parts.append
 
-        outstr += "DBG::\t\t Data Len: %d\n" % (self.header.data_length)
-        outstr += "DBG::\t\t Channel: %s (%d)\n" % (
-            channels[self.channel_number],
-            self.channel_number,
+        append("DBG::\t\t Data Len: %d\n" % (self.header.data_length))
+        append(
+            "DBG::\t\t Channel: %s (%d)\n"
+            % (channels.get(self.channel_number, "UNKNOWN"), self.channel_number)
         )
-        if self.channel_number in [
+        if self.channel_number in (
             _BNO_CHANNEL_CONTROL,
             _BNO_CHANNEL_INPUT_SENSOR_REPORTS,
-        ]:
+        ):
             if self.report_id in reports:
-                outstr += "DBG::\t\t \tReport Type: %s (0x%x)\n" % (
-                    reports[self.report_id],
-                    self.report_id,
+                append(
+                    "DBG::\t\t \tReport Type: %s (0x%x)\n"
+                    % (reports[self.report_id], self.report_id)
                 )
             else:
-                outstr += "DBG::\t\t \t** UNKNOWN Report Type **: %s\n" % hex(
-                    self.report_id
+                append(
+                    "DBG::\t\t \t** UNKNOWN Report Type **: %s\n" % hex(self.report_id)
                 )
 
             if (
-                self.report_id > 0xF0
+                self.report_id > _MIN_CONTROL_REPORT_ID
                 and len(self.data) >= 6
                 and self.data[5] in reports
             ):
-                outstr += "DBG::\t\t \tSensor Report Type: %s(%s)\n" % (
-                    reports[self.data[5]],
-                    hex(self.data[5]),
+                append(
+                    "DBG::\t\t \tSensor Report Type: %s(%s)\n"
+                    % (reports[self.data[5]], hex(self.data[5]))
                 )
 
             if (
@@ -432,23 +511,25 @@ class Packet:
                 and len(self.data) >= 6
                 and self.data[1] in reports
             ):
-                outstr += "DBG::\t\t \tEnabled Feature: %s(%s)\n" % (
-                    reports[self.data[1]],
-                    hex(self.data[5]),
+                append(
+                    "DBG::\t\t \tEnabled Feature: %s(%s)\n"
+                    % (reports[self.data[1]], hex(self.data[5]))
                 )
-        outstr += "DBG::\t\t Sequence number: %s\n" % self.header.sequence_number
-        outstr += "\n"
-        outstr += "DBG::\t\t Data:"
+        append("DBG::\t\t Sequence number: %s\n" % self.header.sequence_number)
+        append("\n")
+        append("DBG::\t\t Data:")
 
+        format_index = "\nDBG::\t\t[0x{:02X}] ".format
+        format_byte = "0x{:02X} ".format
         for idx, packet_byte in enumerate(self.data[:length]):
-            packet_index = idx + 4
+            packet_index = idx + _BNO_HEADER_LEN
             if (packet_index % 4) == 0:
-                outstr += "\nDBG::\t\t[0x{:02X}] ".format(packet_index)
-            outstr += "0x{:02X} ".format(packet_byte)
-        outstr += "\n"
-        outstr += "\t\t*******************************\n"
+                append(format_index(packet_index))
+            append(format_byte(packet_byte))
+        append("\n")
+        append("\t\t*******************************\n")
 
-        return outstr
+        return "".join(parts)
 
     @property
     def report_id(self) -> int:
@@ -463,11 +544,11 @@ class Packet:
     @classmethod
     def header_from_buffer(cls, packet_bytes: bytearray) -> PacketHeader:
         """Creates a `PacketHeader` object from a given buffer"""
-        packet_byte_count = unpack_from("<H", packet_bytes)[0]
+        packet_byte_count, channel_number, sequence_number = unpack_from(
+            _HEADER_FORMAT, packet_bytes
+        )
         packet_byte_count &= ~0x8000
-        channel_number = unpack_from("<B", packet_bytes, offset=2)[0]
-        sequence_number = unpack_from("<B", packet_bytes, offset=3)[0]
-        data_length = max(0, packet_byte_count - 4)
+        data_length = max(0, packet_byte_count - _BNO_HEADER_LEN)
 
         header = PacketHeader(
             channel_number, sequence_number, data_length, packet_byte_count
@@ -498,7 +579,21 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         self._debug: bool = debug
         self._reset: Optional[DigitalInOut] = reset
         self._dbg("********** __init__ *************")
-        self._data_buffer: bytearray = bytearray(DATA_BUFFER_SIZE)
+        # packets are read into alternating buffers so reading a packet doesn't
+        # overwrite the one before it. Sends also use the current buffer, so a
+        # Packet's data is only valid until the next read or send
+        self._data_buffers: List[bytearray] = [
+            bytearray(DATA_BUFFER_SIZE),
+            bytearray(DATA_BUFFER_SIZE),
+        ]
+        self._data_buffer_index: int = 0
+        self._data_buffer: bytearray = self._data_buffers[0]
+        # Packets slice these views so their data isn't copied out of the buffers
+        self._data_views: List[memoryview] = [
+            memoryview(self._data_buffers[0]),
+            memoryview(self._data_buffers[1]),
+        ]
+        self._data_view: memoryview = self._data_views[0]
         self._command_buffer: bytearray = bytearray(12)
         self._packet_slices: List[Any] = []
 
@@ -756,6 +851,7 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
 
     def _send_me_command(self, subcommand_params: Optional[List[int]]) -> None:
         start_time = time.monotonic()
+        deadline = start_time + _DEFAULT_TIMEOUT
         local_buffer = self._command_buffer
         _insert_command_request_report(
             _ME_CALIBRATE,
@@ -765,7 +861,7 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         )
         self._send_packet(_BNO_CHANNEL_CONTROL, local_buffer)
         self._increment_report_seq(_COMMAND_REQUEST)
-        while _elapsed(start_time) < _DEFAULT_TIMEOUT:
+        while time.monotonic() < deadline:
             self._process_available_packets()
             if self._me_calibration_started_at > start_time:
                 break
@@ -774,6 +870,7 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """Save the self-calibration data"""
         # send a DCD save command
         start_time = time.monotonic()
+        deadline = start_time + _DEFAULT_TIMEOUT
         local_buffer = bytearray(12)
         _insert_command_request_report(
             _SAVE_DCD,
@@ -782,7 +879,7 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         )
         self._send_packet(_BNO_CHANNEL_CONTROL, local_buffer)
         self._increment_report_seq(_COMMAND_REQUEST)
-        while _elapsed(start_time) < _DEFAULT_TIMEOUT:
+        while time.monotonic() < deadline:
             self._process_available_packets()
             if self._dcd_saved_at > start_time:
                 return
@@ -802,42 +899,45 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
                 continue
             self._handle_packet(new_packet)
             processed_count += 1
+            if self._debug:
+                # print("Processed", processed_count, "packets")
+                self._dbg("")
+                self._dbg("")
+        if self._debug:
             self._dbg("")
-            # print("Processed", processed_count, "packets")
-            self._dbg("")
-        self._dbg("")
-        self._dbg(" ** DONE! **")
+            self._dbg(" ** DONE! **")
 
     def _wait_for_packet_type(
         self, channel_number: int, report_id: Optional[int] = None, timeout: float = 5.0
     ) -> Packet:
-        if report_id:
-            report_id_str = " with report id %s" % hex(report_id)
-        else:
-            report_id_str = ""
-        self._dbg("** Waiting for packet on channel", channel_number, report_id_str)
-        start_time = time.monotonic()
-        while _elapsed(start_time) < timeout:
+        if self._debug:
+            if report_id:
+                report_id_str = " with report id %s" % hex(report_id)
+            else:
+                report_id_str = ""
+            self._dbg("** Waiting for packet on channel", channel_number, report_id_str)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             new_packet = self._wait_for_packet()
+            packet_channel = new_packet.header.channel_number
 
-            if new_packet.channel_number == channel_number:
-                if report_id:
-                    if new_packet.report_id == report_id:
-                        return new_packet
-                else:
-                    return new_packet
-            if new_packet.channel_number not in (
+            if packet_channel == channel_number and (
+                not report_id or new_packet.data[0] == report_id
+            ):
+                return new_packet
+            if packet_channel not in (
                 BNO_CHANNEL_EXE,
                 BNO_CHANNEL_SHTP_COMMAND,
             ):
-                self._dbg("passing packet to handler for de-slicing")
+                if self._debug:
+                    self._dbg("passing packet to handler for de-slicing")
                 self._handle_packet(new_packet)
 
         raise RuntimeError("Timed out waiting for a packet on channel", channel_number)
 
     def _wait_for_packet(self, timeout: float = _PACKET_READ_TIMEOUT) -> Packet:
-        start_time = time.monotonic()
-        while _elapsed(start_time) < timeout:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             if not self._data_ready:
                 continue
             new_packet = self._read_packet()
@@ -856,7 +956,7 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         # split out reports first
         try:
             _separate_batch(packet, self._packet_slices)
-            while len(self._packet_slices) > 0:
+            while self._packet_slices:
                 self._process_report(*self._packet_slices.pop())
         except Exception as error:
             print(packet)
@@ -910,19 +1010,25 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
                 raise RuntimeError("Unable to save calibration data")
 
     def _process_report(self, report_id: int, report_bytes: bytearray) -> None:
-        if report_id >= 0xF0:
+        if report_id >= _MIN_CONTROL_REPORT_ID:
             self._handle_control_report(report_id, report_bytes)
             return
-        self._dbg("\tProcessing report:", reports[report_id])
+        # the report bytes were already dumped with the packet by _read_packet
         if self._debug:
-            outstr = ""
-            for idx, packet_byte in enumerate(report_bytes):
-                packet_index = idx
-                if (packet_index % 4) == 0:
-                    outstr += "\nDBG::\t\t[0x{:02X}] ".format(packet_index)
-                outstr += "0x{:02X} ".format(packet_byte)
-            self._dbg(outstr)
-            self._dbg("")
+            self._dbg("\tProcessing report:", reports.get(report_id, hex(report_id)))
+
+        # three and four axis reports are nearly all of the steady-state traffic,
+        # so they are picked out first instead of after every special case
+        parser = _SENSOR_REPORT_PARSERS[report_id]
+        if parser is not None:
+            sensor_data, accuracy = parser(report_bytes)
+            if report_id == BNO_REPORT_MAGNETOMETER:
+                self._magnetometer_accuracy = accuracy
+            # TODO: FIXME; Sensor reports are batched in a LIFO which means that multiple
+            # reports for the same type will end with the oldest/last being kept and the
+            # other newer reports thrown away
+            self._readings[report_id] = sensor_data
+            return
 
         if report_id == BNO_REPORT_STEP_COUNTER:
             self._readings[report_id] = _parse_step_couter_report(report_bytes)
@@ -946,27 +1052,30 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         if report_id == BNO_REPORT_ACTIVITY_CLASSIFIER:
             activity_classification = _parse_activity_classifier_report(report_bytes)
             self._readings[BNO_REPORT_ACTIVITY_CLASSIFIER] = activity_classification
-            return
-        sensor_data, accuracy = _parse_sensor_report_data(report_bytes)
-        if report_id == BNO_REPORT_MAGNETOMETER:
-            self._magnetometer_accuracy = accuracy
-        # TODO: FIXME; Sensor reports are batched in a LIFO which means that multiple reports
-        # for the same type will end with the oldest/last being kept and the other
-        # newer reports thrown away
-        self._readings[report_id] = sensor_data
+
+    # shared by every set feature command; only the per-feature fields are rewritten
+    _feature_enable_report = bytearray(17)
+    _feature_enable_report[0] = _SET_FEATURE_COMMAND
 
     # TODO: Make this a Packet creation
-    @staticmethod
+    @classmethod
     def _get_feature_enable_report(
+        cls,
         feature_id: int,
         report_interval: int = _DEFAULT_REPORT_INTERVAL,
         sensor_specific_config: int = 0,
     ) -> bytearray:
-        set_feature_report = bytearray(17)
-        set_feature_report[0] = _SET_FEATURE_COMMAND
+        # the returned buffer is reused, so it must be sent before the next call
+        set_feature_report = cls._feature_enable_report
         set_feature_report[1] = feature_id
-        pack_into("<I", set_feature_report, 5, report_interval)
-        pack_into("<I", set_feature_report, 13, sensor_specific_config)
+        pack_into(
+            _FEATURE_CONFIG_FORMAT,
+            set_feature_report,
+            5,
+            report_interval,
+            0,
+            sensor_specific_config,
+        )
 
         return set_feature_report
 
@@ -977,6 +1086,13 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """Used to enable a given feature of the BNO08x"""
         self._dbg("\n********** Enabling feature id:", feature_id, "**********")
 
+        feature_dependency = _RAW_REPORTS.get(feature_id, None)
+        # if the feature was enabled it will have a key in the readings dict
+        if feature_dependency and feature_dependency not in self._readings:
+            self._dbg("Enabling feature depencency:", feature_dependency)
+            self.enable_feature(feature_dependency)
+
+        # built after any dependency is enabled since the report buffer is shared
         if feature_id == BNO_REPORT_ACTIVITY_CLASSIFIER:
             set_feature_report = self._get_feature_enable_report(
                 feature_id, sensor_specific_config=_ENABLED_ACTIVITIES
@@ -984,18 +1100,12 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         else:
             set_feature_report = self._get_feature_enable_report(feature_id)
 
-        feature_dependency = _RAW_REPORTS.get(feature_id, None)
-        # if the feature was enabled it will have a key in the readings dict
-        if feature_dependency and feature_dependency not in self._readings:
-            self._dbg("Enabling feature depencency:", feature_dependency)
-            self.enable_feature(feature_dependency)
-
         self._dbg("Enabling", feature_id)
         self._send_packet(_BNO_CHANNEL_CONTROL, set_feature_report)
 
-        start_time = time.monotonic()  # 1
+        deadline = time.monotonic() + _FEATURE_ENABLE_TIMEOUT
 
-        while _elapsed(start_time) < _FEATURE_ENABLE_TIMEOUT:
+        while time.monotonic() < deadline:
             self._process_available_packets(max_packets=10)
             if feature_id in self._readings:
                 return
@@ -1028,11 +1138,14 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         if not self._data_buffer[4] == _SHTP_REPORT_PRODUCT_ID_RESPONSE:
             return None
 
-        sw_major = self._get_data(2, "<B")
-        sw_minor = self._get_data(3, "<B")
-        sw_patch = self._get_data(12, "<H")
-        sw_part_number = self._get_data(4, "<I")
-        sw_build_number = self._get_data(8, "<I")
+        # skip the header to get to the report
+        (
+            sw_major,
+            sw_minor,
+            sw_part_number,
+            sw_build_number,
+            sw_patch,
+        ) = unpack_from(_PRODUCT_ID_FORMAT, self._data_buffer, offset=_BNO_HEADER_LEN)
 
         self._dbg("")
         self._dbg("*** Part Number: %d" % sw_part_number)
@@ -1042,15 +1155,12 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         # TODO: this is only one of the numbers!
         return sw_part_number
 
+    # per-packet paths check self._debug before calling this so the call and its
+    # arguments are skipped entirely when debugging is off
     def _dbg(self, *args: Any, **kwargs: Any) -> None:
         if self._debug:
             print("DBG::\t\t", *args, **kwargs)
 
-    def _get_data(self, index: int, fmt_string: str) -> Any:
-        # index arg is not including header, so add 4 into data buffer
-        data_index = index + 4
-        return unpack_from(fmt_string, self._data_buffer, offset=data_index)[0]
-
     # pylint:disable=no-self-use
     @property
     def _data_ready(self) -> None:
@@ -1089,6 +1199,20 @@ class BNO08X:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         self._dbg("OK!")
         # all is good!
 
+    def _swap_data_buffer(self) -> None:
+        """Switch to the other receive buffer before reading a new packet"""
+        self._data_buffer_index ^= 1
+        self._data_buffer = self._data_buffers[self._data_buffer_index]
+        self._data_view = self._data_views[self._data_buffer_index]
+
+    def _resize_data_buffer(self, size: int) -> None:
+        """Replace the current receive buffer with one large enough for `size` bytes"""
+        self._data_buffer = bytearray(size)
+        self._data_view = memoryview(self._data_buffer)
+        # keep the larger buffer so later oversized packets don't allocate again
+        self._data_buffers[self._data_buffer_index] = self._data_buffer
+        self._data_views[self._data_buffer_index] = self._data_view
+
     def _send_packet(self, channel: int, data: bytearray) -> Optional[int]:
         raise RuntimeError("Not implemented")
 
@@ -8,7 +8,7 @@
 """
 from struct import pack_into
 from adafruit_bus_device import i2c_device
-from . import BNO08X, DATA_BUFFER_SIZE, const, Packet, PacketError
+from . import BNO08X, const, Packet, PacketError, _HEADER_FORMAT
 
 _BNO08X_DEFAULT_ADDRESS = const(0x4A)
 
@@ -31,14 +31,19 @@ class BNO08X_I2C(BNO08X):
         data_length = len(data)
         write_length = data_length + 4
 
-        pack_into("<H", self._data_buffer, 0, write_length)
-        self._data_buffer[2] = channel
-        self._data_buffer[3] = self._sequence_number[channel]
+        pack_into(
+            _HEADER_FORMAT,
+            self._data_buffer,
+            0,
+            write_length,
+            channel,
+            self._sequence_number[channel],
+        )
         for idx, send_byte in enumerate(data):
             self._data_buffer[4 + idx] = send_byte
-        packet = Packet(self._data_buffer)
-        self._dbg("Sending packet:")
-        self._dbg(packet)
+        if self._debug:
+            self._dbg("Sending packet:")
+            self._dbg(Packet(self._data_buffer))
         with self.bus_device_obj as i2c:
             i2c.write(self._data_buffer, end=write_length)
 
@@ -53,13 +58,16 @@ class BNO08X_I2C(BNO08X):
         with self.bus_device_obj as i2c:
             i2c.readinto(self._data_buffer, end=4)  # this is expecting a header
         packet_header = Packet.header_from_buffer(self._data_buffer)
-        self._dbg(packet_header)
+        if self._debug:
+            self._dbg(packet_header)
         return packet_header
 
     def _read_packet(self):
+        self._swap_data_buffer()
         with self.bus_device_obj as i2c:
             i2c.readinto(self._data_buffer, end=4)  # this is expecting a header?
-        self._dbg("")
+        if self._debug:
+            self._dbg("")
         # print("SHTP READ packet header: ", [hex(x) for x in self._data_buffer[0:4]])
 
         header = Packet.header_from_buffer(self._data_buffer)
@@ -72,17 +80,18 @@ class BNO08X_I2C(BNO08X):
             self._dbg("SKIPPING NO PACKETS AVAILABLE IN i2c._read_packet")
             raise PacketError("No packet available")
         packet_byte_count -= 4
-        self._dbg(
-            "channel",
-            channel_number,
-            "has",
-            packet_byte_count,
-            "bytes available to read",
-        )
+        if self._debug:
+            self._dbg(
+                "channel",
+                channel_number,
+                "has",
+                packet_byte_count,
+                "bytes available to read",
+            )
 
         self._read(packet_byte_count)
 
-        new_packet = Packet(self._data_buffer)
+        new_packet = Packet(self._data_view, header)
         if self._debug:
             print(new_packet)
 
@@ -92,11 +101,12 @@ class BNO08X_I2C(BNO08X):
 
     # returns true if all requested data was read
     def _read(self, requested_read_length):
-        self._dbg("trying to read", requested_read_length, "bytes")
+        if self._debug:
+            self._dbg("trying to read", requested_read_length, "bytes")
         # +4 for the header
         total_read_length = requested_read_length + 4
-        if total_read_length > DATA_BUFFER_SIZE:
-            self._data_buffer = bytearray(total_read_length)
+        if total_read_length > len(self._data_buffer):
+            self._resize_data_buffer(total_read_length)
             self._dbg(
                 "!!!!!!!!!!!! ALLOCATION: increased _data_buffer to bytearray(%d) !!!!!!!!!!!!! "
                 % total_read_length
@@ -11,7 +11,7 @@ from struct import pack_into
 
 from digitalio import Direction, Pull
 from adafruit_bus_device import spi_device
-from . import BNO08X, DATA_BUFFER_SIZE, _elapsed, Packet, PacketError
+from . import BNO08X, DATA_BUFFER_SIZE, Packet, PacketError, _HEADER_FORMAT
 
 
 class BNO08X_SPI(BNO08X):
@@ -57,8 +57,8 @@ class BNO08X_SPI(BNO08X):
 
     def _wait_for_int(self):
         # print("Waiting for INT...", end="")
-        start_time = time.monotonic()
-        while _elapsed(start_time) < 3.0:
+        deadline = time.monotonic() + 3.0
+        while time.monotonic() < deadline:
             if not self._int.value:
                 break
         else:
@@ -96,14 +96,17 @@ class BNO08X_SPI(BNO08X):
         # read header
         with self._spi as spi:
             spi.readinto(self._data_buffer, end=4, write_value=0x00)
-        self._dbg("")
-        self._dbg("SHTP READ packet header: ", [hex(x) for x in self._data_buffer[0:4]])
+        if self._debug:
+            self._dbg("")
+            self._dbg(
+                "SHTP READ packet header: ", [hex(x) for x in self._data_buffer[0:4]]
+            )
 
     def _read_packet(self):
+        self._swap_data_buffer()
         self._read_header()
         halfpacket = False
 
-        print([hex(x) for x in self._data_buffer[0:4]])
         if self._data_buffer[1] & 0x80:
             halfpacket = True
         header = Packet.header_from_buffer(self._data_buffer)
@@ -115,13 +118,14 @@ class BNO08X_SPI(BNO08X):
         if packet_byte_count == 0:
             raise PacketError("No packet available")
 
-        self._dbg(
-            "channel %d has %d bytes available"
-            % (channel_number, packet_byte_count - 4)
-        )
+        if self._debug:
+            self._dbg(
+                "channel %d has %d bytes available"
+                % (channel_number, packet_byte_count - 4)
+            )
 
-        if packet_byte_count > DATA_BUFFER_SIZE:
-            self._data_buffer = bytearray(packet_byte_count)
+        if packet_byte_count > len(self._data_buffer):
+            self._resize_data_buffer(packet_byte_count)
 
         # re-read header bytes since this is going to be a new transaction
         self._read_into(self._data_buffer, start=0, end=packet_byte_count)
@@ -129,14 +133,15 @@ class BNO08X_SPI(BNO08X):
 
         if halfpacket:
             raise PacketError("read partial packet")
-        new_packet = Packet(self._data_buffer)
+        new_packet = Packet(self._data_view, header)
         if self._debug:
             print(new_packet)
         self._update_sequence_number(new_packet)
         return new_packet
 
     def _read(self, requested_read_length):
-        self._dbg("trying to read", requested_read_length, "bytes")
+        if self._debug:
+            self._dbg("trying to read", requested_read_length, "bytes")
         unread_bytes = 0
         # +4 for the header
         total_read_length = requested_read_length + 4
@@ -152,16 +157,22 @@ class BNO08X_SPI(BNO08X):
         data_length = len(data)
         write_length = data_length + 4
 
-        pack_into("<H", self._data_buffer, 0, write_length)
-        self._data_buffer[2] = channel
-        self._data_buffer[3] = self._sequence_number[channel]
+        pack_into(
+            _HEADER_FORMAT,
+            self._data_buffer,
+            0,
+            write_length,
+            channel,
+            self._sequence_number[channel],
+        )
         for idx, send_byte in enumerate(data):
             self._data_buffer[4 + idx] = send_byte
 
         self._wait_for_int()
         with self._spi as spi:
             spi.write(self._data_buffer, end=write_length)
-        self._dbg("Sending: ", [hex(x) for x in self._data_buffer[0:write_length]])
+        if self._debug:
+            self._dbg("Sending: ", [hex(x) for x in self._data_buffer[0:write_length]])
         self._sequence_number[channel] = (self._sequence_number[channel] + 1) % 256
         return self._sequence_number[channel]
 
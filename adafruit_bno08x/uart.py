@@ -12,9 +12,9 @@ from . import (
     BNO08X,
     BNO_CHANNEL_EXE,
     BNO_CHANNEL_SHTP_COMMAND,
-    DATA_BUFFER_SIZE,
     Packet,
     PacketError,
+    _HEADER_FORMAT,
 )
 
 
@@ -48,9 +48,14 @@ class BNO08X_UART(BNO08X):
         """
         # pylint:enable=pointless-string-statement
 
-        pack_into("<H", self._data_buffer, 0, write_length)
-        self._data_buffer[2] = channel
-        self._data_buffer[3] = self._sequence_number[channel]
+        pack_into(
+            _HEADER_FORMAT,
+            self._data_buffer,
+            0,
+            write_length,
+            channel,
+            self._sequence_number[channel],
+        )
         self._data_buffer[4 : 4 + data_length] = data
         self._uart.write(b"\x7e")  # start byte
         time.sleep(0.001)
@@ -107,6 +112,7 @@ class BNO08X_UART(BNO08X):
         # print("SHTP Header:", [hex(x) for x in self._data_buffer[0:4]])
 
     def _read_packet(self):
+        self._swap_data_buffer()
         self._read_header()
 
         # print([hex(x) for x in self._data_buffer[0:4]])
@@ -119,13 +125,14 @@ class BNO08X_UART(BNO08X):
         if packet_byte_count == 0:
             raise PacketError("No packet available")
 
-        self._dbg(
-            "channel %d has %d bytes available"
-            % (channel_number, packet_byte_count - 4)
-        )
+        if self._debug:
+            self._dbg(
+                "channel %d has %d bytes available"
+                % (channel_number, header.data_length)
+            )
 
-        if packet_byte_count > DATA_BUFFER_SIZE:
-            self._data_buffer = bytearray(packet_byte_count)
+        if packet_byte_count > len(self._data_buffer):
+            self._resize_data_buffer(packet_byte_count)
 
         # skip 4 header bytes since they've already been read
         self._read_into(self._data_buffer, start=4, end=packet_byte_count)
@@ -137,7 +144,7 @@ class BNO08X_UART(BNO08X):
         if b != 0x7E:
             raise RuntimeError("Didn't find packet end")
 
-        new_packet = Packet(self._data_buffer)
+        new_packet = Packet(self._data_view, header)
         if self._debug:
             print(new_packet)
 